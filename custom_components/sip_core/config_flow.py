@@ -10,6 +10,10 @@ from .defaults import sip_config
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_OPTIONS_SCHEMA_BASE = vol.Schema({
+    vol.Required("sip_config"): ObjectSelector(),
+})
+
 
 class SipCoreConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for SIP Core."""
@@ -18,10 +22,6 @@ class SipCoreConfigFlow(ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle user configuration step."""
-        # Abort if already configured
-        await self.async_set_unique_id(DOMAIN)
-        self._abort_if_unique_id_configured()
-        
         # If no user input, show empty form
         if user_input is None:
             return self.async_show_form(
@@ -33,13 +33,12 @@ class SipCoreConfigFlow(ConfigFlow, domain=DOMAIN):
                     "config_info": "SIP Core configuration can be managed through Home Assistant options."
                 }
             )
-        
-        # Validate that configuration is not empty if provided
-        if user_input:
-            return self.async_create_entry(title="SIP Core", data=user_input)
-        
-        # Empty configuration is allowed - will use defaults
-        return self.async_create_entry(title="SIP Core", data={})
+
+        # Abort if already configured
+        await self.async_set_unique_id(DOMAIN)
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(title="SIP Core", data=user_input)
 
     @staticmethod
     @callback
@@ -51,6 +50,13 @@ class SipCoreConfigFlow(ConfigFlow, domain=DOMAIN):
 class SipCoreOptionsFlowHandler(OptionsFlow):
     """Handle SIP Core options flow."""
 
+    def _build_schema(self) -> vol.Schema:
+        """Return the options schema with the current sip_config suggested."""
+        return self.add_suggested_values_to_schema(
+            _OPTIONS_SCHEMA_BASE,
+            {"sip_config": self.config_entry.options.get("sip_config", sip_config)},
+        )
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -60,14 +66,7 @@ class SipCoreOptionsFlowHandler(OptionsFlow):
             if "sip_config" not in user_input or not isinstance(user_input.get("sip_config"), dict):
                 return self.async_show_form(
                     step_id="init",
-                    data_schema=vol.Schema({
-                        vol.Required(
-                            "sip_config",
-                            description={
-                                "suggested_value": self.config_entry.options.get("sip_config", sip_config),
-                            }
-                        ): ObjectSelector(),
-                    }),
+                    data_schema=self._build_schema(),
                     errors={"base": "invalid_config"}
                 )
             
@@ -75,12 +74,5 @@ class SipCoreOptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Required(
-                    "sip_config",
-                    description={
-                        "suggested_value": self.config_entry.options.get("sip_config", sip_config),
-                    }
-                ): ObjectSelector(),
-            })
+            data_schema=self._build_schema(),
         )